@@ -0,0 +1,35 @@
+# Copyright (c) 2018 The Harmonica Developers.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# This code is part of the Fatiando a Terra project (https://www.fatiando.org)
+#
+"""
+Shared pytest configuration and fixtures for the test suite.
+"""
+import numpy as np
+import pytest
+
+from .._forward.point import point_gravity
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_up_numba_point_gravity():
+    """
+    Compile the point_gravity kernels once before the test session
+
+    Numba compiles one kernel per (field, coordinate_system) signature on
+    first call. Trigger each compilation up front on a tiny problem so the
+    tests themselves don't pay the compilation cost, regardless of the order
+    in which they run.
+    """
+    coordinates = (np.zeros(2), np.zeros(2), np.ones(2))
+    points = (np.zeros(1), np.zeros(1), -np.ones(1))
+    masses = np.ones(1)
+    for coordinate_system in ("cartesian", "spherical"):
+        for field in ("potential", "g_e", "g_n", "g_z"):
+            try:
+                point_gravity(coordinates, points, masses, field, coordinate_system)
+            except NotImplementedError:
+                # Spherical coordinates don't implement every field
+                continue
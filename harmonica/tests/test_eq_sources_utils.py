@@ -7,7 +7,6 @@
 """
 Test equivalent sources utility functions
 """
-import warnings
 
 import numpy as np
 import pytest
@@ -22,10 +21,8 @@ def test_pop_extra_coords():
     """
     # Check if extra_coords is removed from kwargs
     kwargs = {"bla": 1, "blabla": 2, "extra_coords": 1400.0}
-    with warnings.catch_warnings(record=True) as warn:
+    with pytest.warns(UserWarning):
         pop_extra_coords(kwargs)
-        assert len(warn) == 1
-        assert issubclass(warn[0].category, UserWarning)
     assert "extra_coords" not in kwargs
 
     # Check if kwargs is not touched if no extra_coords are present
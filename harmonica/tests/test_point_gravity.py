@@ -7,6 +7,7 @@
 """
 Test forward modelling for point masses.
 """
+import functools
 import os
 from pathlib import Path
 
@@ -35,10 +36,24 @@ from .utils import run_only_with_numba
 MODULE_DIR = Path(os.path.dirname(__file__))
 TEST_DATA_DIR = MODULE_DIR / "data"
 
+# Keep every test in this module on the same pytest-xdist worker (when running
+# with --dist loadgroup) so the point_gravity kernels are compiled only once.
+pytestmark = pytest.mark.xdist_group("point_gravity")
+
+# Computation point coordinates shared by the spherical coordinates tests.
+# Build them once at import time instead of once per test. None of the tests
+# should modify these arrays in place.
+LONGITUDE = np.linspace(-180, 180, 37)
+LATITUDE = np.linspace(-90, 90, 19)
+RADIUS = np.logspace(1, 8, 5)
+HEIGHT = np.logspace(0, 4, 5)
+LONGITUDE_EQUATOR = np.linspace(0, 350, 36)
+LONGITUDE_MESH, LATITUDE_MESH, RADIUS_MESH = np.meshgrid(LONGITUDE, LATITUDE, RADIUS)
+
 
 def test_invalid_coordinate_system():
     "Check if invalid coordinate system is passed"
-    coordinates = [0.0, 0.0, 0.0]
+    coordinates = (0.0, 0.0, 0.0)
     point_mass = [0.0, 0.0, 0.0]
     mass = 1.0
     with pytest.raises(ValueError):
@@ -51,39 +66,39 @@ def test_invalid_coordinate_system():
         )
 
 
-def test_not_implemented_field():
+@pytest.mark.parametrize("field", ("g_n", "g_e"))
+def test_not_implemented_field(field):
     """
     Check if NotImplementedError is raised after asking a non-implemented field
     """
-    coordinates = [0.0, 0.0, 0.0]
+    coordinates = (0.0, 0.0, 0.0)
     point_mass = [0.0, 0.0, 0.0]
     mass = 1.0
     coordinate_system = "spherical"
-    for field in ("g_n", "g_e"):
-        with pytest.raises(NotImplementedError):
-            point_gravity(
-                coordinates,
-                point_mass,
-                mass,
-                field,
-                coordinate_system,
-            )
+    with pytest.raises(NotImplementedError):
+        point_gravity(
+            coordinates,
+            point_mass,
+            mass,
+            field,
+            coordinate_system,
+        )
 
 
-def test_invalid_field():
+@pytest.mark.parametrize("coordinate_system", ("spherical", "cartesian"))
+def test_invalid_field(coordinate_system):
     "Check if an invalid gravitational field is passed as argument"
-    coordinates = [0.0, 0.0, 0.0]
+    coordinates = (0.0, 0.0, 0.0)
     point_mass = [0.0, 0.0, 0.0]
     mass = 1.0
-    for coordinate_system in ("spherical", "cartesian"):
-        with pytest.raises(ValueError):
-            point_gravity(
-                coordinates,
-                point_mass,
-                mass,
-                "this-field-does-not-exist",
-                coordinate_system,
-            )
+    with pytest.raises(ValueError):
+        point_gravity(
+            coordinates,
+            point_mass,
+            mass,
+            "this-field-does-not-exist",
+            coordinate_system,
+        )
 
 
 def test_invalid_masses_array():
@@ -92,7 +107,7 @@ def test_invalid_masses_array():
     points = [[-10, 0, 10], [-10, 0, 10], [-100, 0, 100]]
     # Generate a two element masses
     masses = [1000, 2000]
-    coordinates = [0, 0, 250]
+    coordinates = (0, 0, 250)
     with pytest.raises(ValueError):
         point_gravity(
             coordinates,
@@ -118,11 +133,13 @@ def fixture_point_mass():
     return point, mass
 
 
-@pytest.fixture(name="sample_coordinates_potential")
-def fixture_sample_coordinates_potential():
+@functools.lru_cache(maxsize=None)
+def read_sample_point_gravity():
     """
-    Define a sample computation points and the gravity potential field
-    generated by the point_mass.
+    Read and cache the sample point gravity data
+
+    Memoize the parsed arrays so the CSV file is read and tokenized only once
+    per session, no matter how many tests consume the fixture.
     """
     sample_data_file = TEST_DATA_DIR / "sample_point_gravity.csv"
     easting, northing, upward, potential = np.loadtxt(
@@ -131,6 +148,15 @@ def fixture_sample_coordinates_potential():
     return (easting, northing, upward, potential)
 
 
+@pytest.fixture(name="sample_coordinates_potential", scope="module")
+def fixture_sample_coordinates_potential():
+    """
+    Define a sample computation points and the gravity potential field
+    generated by the point_mass.
+    """
+    return read_sample_point_gravity()
+
+
 @pytest.mark.use_numba
 def test_potential_cartesian_known_values(point_mass, sample_coordinates_potential):
     """
@@ -144,68 +170,80 @@ def test_potential_cartesian_known_values(point_mass, sample_coordinates_potenti
     npt.assert_allclose(results, precomputed_potential)
 
 
-@pytest.mark.use_numba
-def test_potential_symmetry_cartesian():
+def symmetric_computation_points(point_mass, distance):
     """
-    Test if potential field of a point mass has symmetry in Cartesian coords
+    Define six computation points at a fixed distance from the point mass
+
+    Build a pair of computation points on each side of the point mass along
+    each Cartesian direction: easting (indices 0 and 1), northing (indices
+    2 and 3) and upward (indices 4 and 5).
     """
-    # Define a single point mass
-    point_mass = [1.1, 1.2, 1.3]
-    masses = [2670]
-    # Define a set of computation points at a fixed distance from the point
-    # mass
-    distance = 3.3
-    easting = point_mass[0] * np.ones(6)
-    northing = point_mass[1] * np.ones(6)
-    upward = point_mass[2] * np.ones(6)
+    easting = np.full(6, point_mass[0])
+    northing = np.full(6, point_mass[1])
+    upward = np.full(6, point_mass[2])
     easting[0] += distance
     easting[1] -= distance
     northing[2] += distance
     northing[3] -= distance
     upward[4] += distance
     upward[5] -= distance
-    coordinates = [easting, northing, upward]
-    # Compute potential gravity field on each computation point
-    results = point_gravity(coordinates, point_mass, masses, "potential", "cartesian")
-    npt.assert_allclose(*results)
+    return (easting, northing, upward)
 
 
 @pytest.mark.use_numba
-@pytest.mark.parametrize("field", ("g_n", "g_e", "g_z"))
-def test_acceleration_symmetry_cartesian(field):
+@pytest.mark.parametrize(
+    "field, index_pair",
+    [("potential", None), ("g_e", (0, 1)), ("g_n", (2, 3)), ("g_z", (4, 5))],
+)
+def test_symmetry_cartesian(field, index_pair):
     """
-    Test if the acceleration components verify the expected symmetry
+    Test if the fields of a point mass verify the expected symmetry
 
-    Use Cartesian coordinates
+    Compute each field on the same six symmetric computation points with
+    a single forward model call per field. The potential should be equal on
+    every point, while each acceleration component should have opposite
+    values on the pair of points along its direction and be zero on the
+    remaining ones.
     """
     # Define a single point mass
     point_mass = [1.1, 1.2, 1.3]
     masses = [2670]
-    # Define a pair of computation points at each side of the point mass along
-    # the direction given by the field parameter
+    # Define a set of computation points at a fixed distance from the point
+    # mass
     distance = 3.3
-    easting = point_mass[0] * np.ones(2)
-    northing = point_mass[1] * np.ones(2)
-    upward = point_mass[2] * np.ones(2)
-    if field == "g_n":
-        northing[0] += distance
-        northing[1] -= distance
-    elif field == "g_e":
-        easting[0] += distance
-        easting[1] -= distance
-    elif field == "g_z":
-        upward[0] += distance
-        upward[1] -= distance
-    coordinates = [easting, northing, upward]
-    # Compute gravity acceleration component on each computation point
+    coordinates = symmetric_computation_points(point_mass, distance)
+    # Compute the gravity field on each computation point
     results = point_gravity(coordinates, point_mass, masses, field, "cartesian")
-    npt.assert_allclose(results[0], -results[1])
+    # Check for the expected symmetry
+    if field == "potential":
+        npt.assert_allclose(results[0], results[1:])
+    else:
+        first, second = index_pair
+        npt.assert_allclose(results[first], -results[second])
+        npt.assert_allclose(np.delete(results, index_pair), 0)
+
 
+@functools.lru_cache(maxsize=None)
+def distance_to_point(coordinates, point):
+    """
+    Compute and cache the distance between a computation point and a source
 
-def acceleration_finite_differences(coordinates, point, mass, field, delta=0.05):
+    The finite-difference helpers use this distance only to bound the error
+    of the approximation and they always get the same few tuples of scalars,
+    so cache the result instead of dispatching into the Numba function on
+    every call.
+    """
+    return distance_cartesian(coordinates, point)
+
+
+def acceleration_finite_differences(coordinates, point, mass, delta=0.05):
     """
     Compute acceleration components through finite differences
 
+    Approximate every acceleration component at once: stack the pair of
+    probe points for each direction into a single six-point array and run
+    a single forward model call for the potential.
+
     Parameters
     ----------
     coordinates : tuple
@@ -215,51 +253,43 @@ def acceleration_finite_differences(coordinates, point, mass, field, delta=0.05)
         The coordinates of the point source.
     mass : float
         Mass of the point source.
-    field : str
-        Acceleration component that needs to be approximated ("g_e",
-        "g_n", "g_z").
     delta : float
         Distance use to compute the finite difference in meters.
 
     Returns
     -------
-    finite_diff : float
-        Approximation of the acceleration component.
+    finite_diff : dict
+        Approximation of each acceleration component ("g_e", "g_n", "g_z").
     error : float
-        Relative error of the approximation (unitless).
-    """
-    # Build a two computation points slightly shifted from the original
-    # computation point by a small delta
-    coordinates_pair = tuple([coord, coord] for coord in coordinates)
-    if field == "g_e":
-        index = 0
-    elif field == "g_n":
-        index = 1
-    elif field == "g_z":
-        index = 2
-    coordinates_pair[index][0] -= delta
-    coordinates_pair[index][1] += delta
-    # Compute the potential on both points
+        Relative error of the approximations (unitless).
+    """
+    # Build a pair of computation points per direction, slightly shifted from
+    # the original computation point by a small delta along that direction
+    fields = ("g_e", "g_n", "g_z")
+    coordinates_pairs = tuple(np.full(6, coord, dtype=float) for coord in coordinates)
+    for index in range(3):
+        coordinates_pairs[index][2 * index] -= delta
+        coordinates_pairs[index][2 * index + 1] += delta
+    # Compute the potential on every probe point with a single call
     potential = point_gravity(
-        coordinates_pair, point, mass, field="potential", coordinate_system="cartesian"
+        coordinates_pairs, point, mass, field="potential", coordinate_system="cartesian"
     )
-    # Compute the difference between the two values
-    finite_diff = (potential[1] - potential[0]) / (2 * delta)
-    # Convert to mGal
-    finite_diff *= 1e5
+    # Compute the difference between each pair of values and convert to mGal
+    finite_diff = {
+        field: (potential[2 * index + 1] - potential[2 * index]) / (2 * delta) * 1e5
+        for index, field in enumerate(fields)
+    }
     # Remember that the ``g_z`` field returns the downward component of the
     # gravitational acceleration. As a consequence, the numerical
     # derivative is multiplied by -1.
-    if field == "g_z":
-        finite_diff *= -1
+    finite_diff["g_z"] *= -1
     # Compute the bounding error of the approximation
-    distance = distance_cartesian(coordinates, point)
+    distance = distance_to_point(coordinates, point)
     relative_error = 3 / 2 * (delta / distance) ** 2
     return finite_diff, relative_error
 
 
 @pytest.mark.use_numba
-@pytest.mark.parametrize("field", ("g_n", "g_e", "g_z"))
 @pytest.mark.parametrize(
     "coordinates, point, mass",
     (
@@ -268,18 +298,18 @@ def acceleration_finite_differences(coordinates, point, mass, field, delta=0.05)
     ),
     ids=["set1", "set2"],
 )
-def test_acceleration_finite_diff_cartesian(coordinates, point, mass, field):
+def test_acceleration_finite_diff_cartesian(coordinates, point, mass):
     """
     Test acceleration components against a finite difference of the potential
     """
-    # Compute the z component
-    result = point_gravity(coordinates, point, mass, field, "cartesian")
-    # Compute the derivative of potential through finite differences
+    # Compute the derivatives of the potential through finite differences
     finite_diff, relative_error = acceleration_finite_differences(
-        coordinates, point, mass, field
+        coordinates, point, mass
     )
-    # Compare the results
-    npt.assert_allclose(result, finite_diff, rtol=relative_error)
+    # Compare each acceleration component with its approximation
+    for field, expected in finite_diff.items():
+        result = point_gravity(coordinates, point, mass, field, "cartesian")
+        npt.assert_allclose(result, expected, rtol=relative_error)
 
 
 @pytest.mark.use_numba
@@ -292,19 +322,34 @@ def test_acceleration_sign(field):
     point_mass = [-10, 100.2, -300.7]
     mass = [2670]
     # Define computation points
-    coordinates = [np.zeros(3) for i in range(3)]
+    easting, northing, upward = (np.zeros(3) for _ in range(3))
     if field == "g_e":
-        coordinates[0] = np.array([-150.7, -10, 79])
+        easting = np.array([-150.7, -10.0, 79.0])
     elif field == "g_n":
-        coordinates[1] = np.array([0, 100.2, 210.7])
+        northing = np.array([0.0, 100.2, 210.7])
     elif field == "g_z":
-        coordinates[2] = np.array([100.11, -300.7, -400])
+        upward = np.array([100.11, -300.7, -400.0])
+    coordinates = (easting, northing, upward)
     # Compute acceleration component
     results = point_gravity(coordinates, point_mass, mass, field, "cartesian")
-    # Check if the sign of the results is right
-    assert np.sign(mass) == np.sign(results[0])
-    npt.assert_allclose(results[1], 0)
-    assert np.sign(mass) == -np.sign(results[2])
+    # Check if the sign of the results is right with a single check
+    npt.assert_allclose(np.sign(results), np.sign(mass) * np.array([1.0, 0.0, -1.0]))
+
+
+@pytest.fixture(name="sample_masses_cartesian", scope="module")
+def fixture_sample_masses_cartesian():
+    """
+    Define a set of scattered point masses and a grid of computation points
+
+    Share the same points, masses and coordinates across every Cartesian test
+    that forward models them, so the scatter and the grid are built only once
+    per module.
+    """
+    region = (2e3, 10e3, -3e3, 5e3)
+    points = vd.scatter_points(region, size=30, extra_coords=-1e3, random_state=0)
+    masses = np.arange(points[0].size)
+    coordinates = vd.grid_coordinates(region=region, spacing=1e3, extra_coords=0)
+    return points, masses, coordinates
 
 
 @run_only_with_numba
@@ -317,14 +362,11 @@ def test_acceleration_sign(field):
     ),
     # fmt: on
 )
-def test_point_mass_cartesian_parallel(field):
+def test_point_mass_cartesian_parallel(field, sample_masses_cartesian):
     """
     Check if parallel and serial runs return the same result
     """
-    region = (2e3, 10e3, -3e3, 5e3)
-    points = vd.scatter_points(region, size=30, extra_coords=-1e3, random_state=0)
-    masses = np.arange(points[0].size)
-    coordinates = vd.grid_coordinates(region=region, spacing=1e3, extra_coords=0)
+    points, masses, coordinates = sample_masses_cartesian
     result_serial = point_gravity(
         coordinates, points, masses, field=field, parallel=False
     )
@@ -335,16 +377,13 @@ def test_point_mass_cartesian_parallel(field):
 
 
 @pytest.mark.use_numba
-def test_laplace_equation_cartesian():
+def test_laplace_equation_cartesian(sample_masses_cartesian):
     """
     Check if the diagonal components of the tensor satisfy Laplace equation
 
     Use Cartesian coordinates.
     """
-    region = (2e3, 10e3, -3e3, 5e3)
-    points = vd.scatter_points(region, size=30, extra_coords=-1e3, random_state=0)
-    masses = np.arange(points[0].size)
-    coordinates = vd.grid_coordinates(region=region, spacing=1e3, extra_coords=0)
+    points, masses, coordinates = sample_masses_cartesian
     g_ee = point_gravity(coordinates, points, masses, field="g_ee")
     g_nn = point_gravity(coordinates, points, masses, field="g_nn")
     g_zz = point_gravity(coordinates, points, masses, field="g_zz")
@@ -356,14 +395,11 @@ def test_laplace_equation_cartesian():
 @pytest.mark.parametrize(
     "field, flipped_field", [("g_en", "g_ne"), ("g_ez", "g_ze"), ("g_nz", "g_zn")]
 )
-def test_tensor_non_diagonal_components(field, flipped_field):
+def test_tensor_non_diagonal_components(field, flipped_field, sample_masses_cartesian):
     """
     Check if function computes g_xy as the same as g_yx
     """
-    region = (2e3, 10e3, -3e3, 5e3)
-    points = vd.scatter_points(region, size=30, extra_coords=-1e3, random_state=0)
-    masses = np.arange(points[0].size)
-    coordinates = vd.grid_coordinates(region=region, spacing=1e3, extra_coords=0)
+    points, masses, coordinates = sample_masses_cartesian
     npt.assert_allclose(
         point_gravity(coordinates, points, masses, field=field),
         point_gravity(coordinates, points, masses, field=flipped_field),
@@ -414,9 +450,9 @@ class TestTensorSymmetryCartesian:
             in the following order: easting, northing, upward.
         """
         distance = 3.3
-        easting = self.point[0] * np.ones(2)
-        northing = self.point[1] * np.ones(2)
-        upward = self.point[2] * np.ones(2)
+        easting = np.full(2, self.point[0])
+        northing = np.full(2, self.point[1])
+        upward = np.full(2, self.point[2])
         direction_shift, direction_mirror = directions[:]
         # Shift computation points
         if direction_shift == "n":
@@ -479,9 +515,9 @@ class TestTensorSymmetryCartesian:
             in the following order: easting, northing, upward.
         """
         distance = 3.3
-        easting = self.point[0] * np.ones(2)
-        northing = self.point[1] * np.ones(2)
-        upward = self.point[2] * np.ones(2)
+        easting = np.full(2, self.point[0])
+        northing = np.full(2, self.point[1])
+        upward = np.full(2, self.point[2])
         if "n" in directions:
             northing[0] += distance
             northing[1] -= distance
@@ -590,7 +626,7 @@ def tensor_finite_differences(coordinates, point, mass, field, delta=0.05):
     if direction_i == "z" or direction_j == "z":
         finite_diff *= -1
     # Compute the bounding error of the approximation
-    distance = distance_cartesian(coordinates, point)
+    distance = distance_to_point(coordinates, point)
     relative_error = 6 * (delta / distance) ** 2
     return finite_diff, relative_error
 
@@ -627,10 +663,7 @@ def test_point_mass_on_origin():
     "Check potential and g_z of point mass on origin in spherical coordinates"
     point_mass = [0.0, 0.0, 0.0]
     mass = 2.0
-    radius = np.logspace(1, 8, 5)
-    longitude = np.linspace(-180, 180, 37)
-    latitude = np.linspace(-90, 90, 19)
-    longitude, latitude, radius = np.meshgrid(longitude, latitude, radius)
+    longitude, latitude, radius = LONGITUDE_MESH, LATITUDE_MESH, RADIUS_MESH
     # Analytical solutions (accelerations are in mGal and tensor components in
     # eotvos)
     analytical = {
@@ -655,26 +688,32 @@ def test_point_mass_same_radial_direction(field):
     """
     sphere_radius = 3.0
     mass = 2.0
-    for longitude in np.linspace(-180, 180, 37):
-        for latitude in np.linspace(-90, 90, 19):
-            for height in np.logspace(0, 4, 5):
-                point_mass = [longitude, latitude, sphere_radius]
-                coordinates = [
-                    np.array(longitude),
-                    np.array(latitude),
-                    np.array(height + sphere_radius),
-                ]
-                # Analytical solutions
-                # (accelerations are in mGal and tensor components in eotvos)
-                analytical = {
-                    "potential": GRAVITATIONAL_CONST * mass / height,
-                    "g_z": GRAVITATIONAL_CONST * mass / height**2 * 1e5,
-                }
-                # Compare results with analytical solutions
-                npt.assert_allclose(
-                    point_gravity(coordinates, point_mass, mass, field, "spherical"),
-                    analytical[field],
-                )
+    height = HEIGHT
+    # Analytical solutions
+    # (accelerations are in mGal and tensor components in eotvos)
+    analytical = {
+        "potential": GRAVITATIONAL_CONST * mass / height,
+        "g_z": GRAVITATIONAL_CONST * mass / height**2 * 1e5,
+    }
+    # The forward model sums the contribution of every source on each
+    # computation point, so each point-mass location needs its own call.
+    # Vectorize the height axis to compute all heights above a given point
+    # mass in a single call.
+    results = []
+    for longitude in LONGITUDE:
+        for latitude in LATITUDE:
+            point_mass = [longitude, latitude, sphere_radius]
+            coordinates = (
+                np.full_like(height, longitude),
+                np.full_like(height, latitude),
+                height + sphere_radius,
+            )
+            results.append(
+                point_gravity(coordinates, point_mass, mass, field, "spherical")
+            )
+    # Compare results with analytical solutions with a single check
+    expected = np.tile(analytical[field], LONGITUDE.size * LATITUDE.size)
+    npt.assert_allclose(np.concatenate(results), expected)
 
 
 @pytest.mark.use_numba
@@ -683,28 +722,27 @@ def test_point_mass_potential_on_equator():
     radius = 3.0
     mass = 2.0
     latitude = 0.0
-    for longitude_p in np.linspace(0, 350, 36):
+    results, expected = [], []
+    for longitude_p in LONGITUDE_EQUATOR:
         point_mass = [longitude_p, latitude, radius]
-        for longitude in np.linspace(0, 350, 36):
-            if longitude != longitude_p:
-                coordinates = [
-                    np.array(longitude),
-                    np.array(latitude),
-                    np.array(radius),
-                ]
-                # Analytical solutions
-                # (accelerations are in mGal and tensor components in eotvos)
-                distance = (
-                    2 * radius * np.sin(0.5 * np.radians(abs(longitude - longitude_p)))
-                )
-                analytical = {"potential": GRAVITATIONAL_CONST * mass / distance}
-                # Compare results with analytical solutions
-                npt.assert_allclose(
-                    point_gravity(
-                        coordinates, point_mass, mass, "potential", "spherical"
-                    ),
-                    analytical["potential"],
-                )
+        # Compute on every other longitude along the equator in a single call
+        longitude = LONGITUDE_EQUATOR[LONGITUDE_EQUATOR != longitude_p]
+        coordinates = (
+            longitude,
+            np.full_like(longitude, latitude),
+            np.full_like(longitude, radius),
+        )
+        results.append(
+            point_gravity(coordinates, point_mass, mass, "potential", "spherical")
+        )
+        # Analytical solutions
+        # (accelerations are in mGal and tensor components in eotvos)
+        distance = (
+            2 * radius * np.sin(0.5 * np.radians(np.abs(longitude - longitude_p)))
+        )
+        expected.append(GRAVITATIONAL_CONST * mass / distance)
+    # Compare results with analytical solutions with a single check
+    npt.assert_allclose(np.concatenate(results), np.concatenate(expected))
 
 
 @pytest.mark.use_numba
@@ -713,34 +751,34 @@ def test_point_mass_potential_on_same_meridian():
     radius = 3.0
     mass = 2.0
     longitude = 0.0
-    for latitude_p in np.linspace(-90, 90, 19):
+    results, expected = [], []
+    for latitude_p in LATITUDE:
         point_mass = [longitude, latitude_p, radius]
-        for latitude in np.linspace(-90, 90, 19):
-            if latitude != latitude_p:
-                coordinates = [
-                    np.array(longitude),
-                    np.array(latitude),
-                    np.array(radius),
-                ]
-                # Analytical solutions
-                # (accelerations are in mGal and tensor components in eotvos)
-                distance = (
-                    2 * radius * np.sin(0.5 * np.radians(abs(latitude - latitude_p)))
-                )
-                analytical = {"potential": GRAVITATIONAL_CONST * mass / distance}
-                # Compare results with analytical solutions
-                npt.assert_allclose(
-                    point_gravity(
-                        coordinates, point_mass, mass, "potential", "spherical"
-                    ),
-                    analytical["potential"],
-                )
+        # Compute on every other latitude along the meridian in a single call
+        latitude = LATITUDE[LATITUDE != latitude_p]
+        coordinates = (
+            np.full_like(latitude, longitude),
+            latitude,
+            np.full_like(latitude, radius),
+        )
+        results.append(
+            point_gravity(coordinates, point_mass, mass, "potential", "spherical")
+        )
+        # Analytical solutions
+        # (accelerations are in mGal and tensor components in eotvos)
+        distance = 2 * radius * np.sin(0.5 * np.radians(np.abs(latitude - latitude_p)))
+        expected.append(GRAVITATIONAL_CONST * mass / distance)
+    # Compare results with analytical solutions with a single check
+    npt.assert_allclose(np.concatenate(results), np.concatenate(expected))
 
 
-@run_only_with_numba
-def test_point_mass_spherical_parallel():
+@pytest.fixture(name="sample_masses_spherical", scope="module")
+def fixture_sample_masses_spherical():
     """
-    Check if parallel and serial runs return the same result
+    Define a set of scattered point masses and a grid of computation points
+
+    Same as sample_masses_cartesian, but in spherical coordinates: build the
+    scatter and the grid only once per module.
     """
     region = (2, 10, -3, 5)
     radius = 6400e3
@@ -749,6 +787,15 @@ def test_point_mass_spherical_parallel():
     )
     masses = np.arange(points[0].size)
     coordinates = vd.grid_coordinates(region=region, spacing=1, extra_coords=radius)
+    return points, masses, coordinates
+
+
+@run_only_with_numba
+def test_point_mass_spherical_parallel(sample_masses_spherical):
+    """
+    Check if parallel and serial runs return the same result
+    """
+    points, masses, coordinates = sample_masses_spherical
     for field in ("potential", "g_z"):
         result_serial = point_gravity(
             coordinates,
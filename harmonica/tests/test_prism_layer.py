@@ -319,10 +319,8 @@ def test_nonans_prisms_mask_property(
         (easting, northing), surface, reference, properties={"density": density}
     )
     # Check if warning is raised
-    with warnings.catch_warnings(record=True) as warn:
+    with pytest.warns(UserWarning):
         mask = layer.prism_layer._get_nonans_mask(property_name="density")
-        assert len(warn) == 1
-        assert issubclass(warn[-1].category, UserWarning)
     npt.assert_allclose(mask, expected_mask)
 
 
@@ -388,9 +386,8 @@ def test_prism_layer_gravity_density_nans(field, dummy_layer, prism_layer_with_h
         prisms_coords, surface, reference, properties={"density": density}
     )
     # Check if warning is raised after passing density with nans
-    with warnings.catch_warnings(record=True) as warn:
+    with pytest.warns(UserWarning):
         result = layer.prism_layer.gravity(coordinates, field=field)
-        assert len(warn) == 1
     # Check if it generates the expected gravity field
     prisms, rho = prism_layer_with_holes
     npt.assert_allclose(